@@ -8,18 +8,20 @@ from typing import List, Tuple, Dict, Any
 sys.path.append('/content/COMP5423-RAG-System')
 
 from retrieval.tfidf_retriever import TFIDFRetriever
+from retrieval.chunk_retriever import ChunkRetriever
 from generation.basic_generator import BasicGenerator
 from utils.data_loader import DataLoader
 
 class RAGSystem:
     """主RAG系统 - 整合所有模块"""
     
-    def __init__(self, model_name: str = "Qwen/Qwen2.5-0.5B-Instruct"):
+    def __init__(self, model_name: str = "Qwen/Qwen2.5-0.5B-Instruct", use_chunking: bool = True):
         """
         初始化RAG系统
         
         Args:
             model_name: 使用的模型名称
+            use_chunking: 是否使用段落级索引 (仅将最佳段落传给生成器)
         """
         print("🚀 初始化RAG系统...")
         
@@ -34,7 +36,11 @@ class RAGSystem:
         self.collection_df = data['collection']
         
         # 初始化模块
-        self.retriever = TFIDFRetriever(self.documents, self.doc_ids)
+        self.use_chunking = use_chunking
+        if use_chunking:
+            self.retriever = ChunkRetriever(self.documents, self.doc_ids)
+        else:
+            self.retriever = TFIDFRetriever(self.documents, self.doc_ids)
         self.generator = BasicGenerator(model_name)
         
         print("✅ RAG系统初始化完成")
@@ -150,7 +156,7 @@ class RAGSystem:
             'document_count': len(self.documents),
             'train_samples': len(self.train_df),
             'validation_samples': len(self.validation_df),
-            'retrieval_method': 'TF-IDF'
+            'retrieval_method': 'TF-IDF (段落级)' if self.use_chunking else 'TF-IDF'
         }
 
 if __name__ == "__main__":
@@ -60,7 +60,16 @@ def main():
         print(f"测试问题: {test_question}")
         print(f"测试答案: {answer}")
         print(f"检索文档数: {len(docs)}")
-        
+
+        # 测试查询编码器性能
+        from retrieval.query_encoder import benchmark_query_encoder
+        sample_questions = data_loader.get_sample_questions(200, 'validation')
+        bench = benchmark_query_encoder(rag_system.retriever.query_encoder, sample_questions)
+        print(f"查询编码: transform {bench['transform_us']:.1f}us | "
+              f"快速路径 {bench['encoder_us']:.1f}us ({bench['speedup']:.1f}x) | "
+              f"缓存命中 {bench['cached_us']:.1f}us ({bench['cached_speedup']:.1f}x) | "
+              f"最大误差 {bench['max_abs_diff']:.2e}")
+
         print("✅ 系统测试完成")
     
     else:
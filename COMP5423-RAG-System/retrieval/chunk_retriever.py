@@ -0,0 +1,141 @@
+
+import numpy as np
+from typing import List, Dict
+
+from retrieval.tfidf_retriever import TFIDFRetriever
+from utils.passage_chunker import PassageChunker
+
+class ChunkRetriever:
+    """段落级检索器 - 在段落上建立TF-IDF索引，并聚合为文档级结果"""
+
+    def __init__(self, documents: List[str], doc_ids: List[str],
+                 chunk_size: int = 50, overlap: int = 10,
+                 aggregation: str = 'max', chunks_per_doc: int = 1,
+                 sum_top_k: int = 2):
+        """
+        初始化段落级检索器
+
+        Args:
+            documents: 文档内容列表
+            doc_ids: 文档ID列表
+            chunk_size: 每个段落的词数
+            overlap: 相邻段落之间重叠的词数
+            aggregation: 段落分数聚合为文档分数的方式 (max/sum)
+            chunks_per_doc: 每个文档传给生成器的最佳段落数量
+            sum_top_k: sum聚合时每个文档累加的最高分段落数量
+        """
+        if aggregation not in ('max', 'sum'):
+            raise ValueError(f"不支持的聚合方式: {aggregation}")
+        self.documents = documents
+        self.doc_ids = doc_ids
+        self.aggregation = aggregation
+        self.chunks_per_doc = chunks_per_doc
+        self.sum_top_k = sum_top_k
+
+        print("正在切分文档...")
+        self.chunker = PassageChunker(chunk_size, overlap)
+        chunked = self.chunker.chunk_documents(documents, doc_ids)
+        self.chunks = chunked['chunks']
+        self.chunk_ids = chunked['chunk_ids']
+        self.chunk_spans = chunked['chunk_spans']
+        # 每个文档的段落在索引中连续存放，doc_offsets[i]为文档i的首个段落位置
+        self.doc_offsets = np.array(chunked['doc_offsets'], dtype=np.int64)
+        self.doc_ends = np.append(self.doc_offsets[1:], len(self.chunks))
+        self.doc_chunk_counts = self.doc_ends - self.doc_offsets
+        print(f"段落库大小: {len(self.chunks)} 个段落")
+
+        self.chunk_retriever = TFIDFRetriever(self.chunks, self.chunk_ids)
+        self.query_encoder = self.chunk_retriever.query_encoder
+
+    def aggregate_scores(self, chunk_scores: np.ndarray) -> np.ndarray:
+        """
+        将段落分数聚合为文档分数
+
+        max取文档中最高的段落分数；sum只累加文档中最高的sum_top_k个段落分数，
+        避免长文档仅因段落更多 (且相互重叠) 而获得更高分数。
+
+        Args:
+            chunk_scores: 每个段落的相似度分数
+
+        Returns:
+            np.ndarray: 每个文档的聚合分数
+        """
+        if self.aggregation == 'max':
+            return np.maximum.reduceat(chunk_scores, self.doc_offsets)
+
+        remaining = chunk_scores.copy()
+        positions = np.arange(len(remaining))
+        doc_scores = np.zeros(len(self.doc_offsets))
+        for _ in range(self.sum_top_k):
+            best = np.maximum.reduceat(remaining, self.doc_offsets)
+            # 段落数不足sum_top_k的文档此时best为-inf，不再累加
+            doc_scores += np.where(np.isfinite(best), best, 0.0)
+            # 每个文档移除一个当前最高分段落
+            is_best = remaining == np.repeat(best, self.doc_chunk_counts)
+            first_best = np.minimum.reduceat(np.where(is_best, positions, len(remaining)), self.doc_offsets)
+            remaining[first_best] = -np.inf
+        return doc_scores
+
+    def build_context(self, doc_idx: int, chunk_indices: List[int]) -> str:
+        """
+        将文档中选中的段落拼接为生成器上下文
+
+        相邻或重叠的段落合并为一个连续片段 (重叠部分只保留一次)，
+        不相邻的片段之间以" ... "分隔；若选中段落覆盖整篇文档则直接返回原文。
+
+        Args:
+            doc_idx: 文档下标
+            chunk_indices: 按原文顺序排列的段落下标
+
+        Returns:
+            str: 拼接后的上下文
+        """
+        text = self.documents[doc_idx]
+        words = text.split()
+
+        merged = []
+        for i in chunk_indices:
+            start, end = self.chunk_spans[i]
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        if len(merged) == 1 and merged[0] == [0, len(words)]:
+            return text
+        return " ... ".join(" ".join(words[start:end]) for start, end in merged)
+
+    def retrieve(self, query: str, top_k: int = 10) -> List[Dict]:
+        """
+        检索最相关的文档，文档内容仅保留得分最高的段落
+
+        Args:
+            query: 查询文本
+            top_k: 返回的文档数量
+
+        Returns:
+            List[Dict]: 检索到的文档列表，每个文档包含id, content, score, chunk_ids
+        """
+        try:
+            chunk_scores = self.chunk_retriever.score(query)
+            doc_scores = self.aggregate_scores(chunk_scores)
+
+            top_indices = doc_scores.argsort()[-top_k:][::-1]
+
+            retrieved_docs = []
+            for idx in top_indices:
+                start, end = self.doc_offsets[idx], self.doc_ends[idx]
+                best = chunk_scores[start:end].argsort()[::-1][:self.chunks_per_doc]
+                # 按原文顺序拼接最佳段落
+                best_chunks = [start + i for i in sorted(best)]
+                retrieved_docs.append({
+                    'id': self.doc_ids[idx],
+                    'content': self.build_context(idx, best_chunks),
+                    'score': float(doc_scores[idx]),
+                    'chunk_ids': [self.chunk_ids[i] for i in best_chunks]
+                })
+
+            return retrieved_docs
+        except Exception as e:
+            print(f"检索错误: {e}")
+            return []
@@ -0,0 +1,167 @@
+
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+class QueryEncoder:
+    """查询编码器 - 基于已拟合TfidfVectorizer的单查询快速路径"""
+
+    def __init__(self, vectorizer: TfidfVectorizer, cache_size: int = 1024):
+        """
+        从已拟合的向量化器构建查询编码器
+
+        Args:
+            vectorizer: 已调用过fit/fit_transform的TfidfVectorizer
+            cache_size: LRU缓存的查询数量上限 (0表示不缓存)
+        """
+        self.vectorizer = vectorizer
+        self.vocabulary = vectorizer.vocabulary_
+        self.n_features = len(self.vocabulary)
+        self.dtype = vectorizer.dtype
+        self.idf = vectorizer.idf_ if vectorizer.use_idf else None
+        self.norm = vectorizer.norm
+        self.binary = vectorizer.binary
+        self.sublinear_tf = vectorizer.sublinear_tf
+
+        # 仅默认的word分词配置走快速路径，其余情况回退到sklearn的analyzer
+        self.fast_path = (
+            vectorizer.analyzer == 'word'
+            and tuple(vectorizer.ngram_range) == (1, 1)
+            and vectorizer.tokenizer is None
+            and vectorizer.preprocessor is None
+            and vectorizer.strip_accents is None
+        )
+        if self.fast_path:
+            self.token_regex = re.compile(vectorizer.token_pattern)
+            if self.token_regex.groups > 1:
+                raise ValueError("token_pattern最多只能包含一个捕获组")
+            self.lowercase = vectorizer.lowercase
+            self.stop_words = vectorizer.get_stop_words() or frozenset()
+        else:
+            self.analyzer = vectorizer.build_analyzer()
+
+        if cache_size > 0:
+            self.encode = lru_cache(maxsize=cache_size)(self.encode_uncached)
+        else:
+            self.encode = self.encode_uncached
+
+    def tokenize(self, query: str) -> List[str]:
+        """将查询切分为词项 (与vectorizer.build_analyzer()结果一致)"""
+        if not self.fast_path:
+            return self.analyzer(query)
+        if self.lowercase:
+            query = query.lower()
+        stop_words = self.stop_words
+        return [token for token in self.token_regex.findall(query) if token not in stop_words]
+
+    def encode_uncached(self, query: str) -> csr_matrix:
+        """
+        编码单个查询 (不经过缓存)
+
+        Args:
+            query: 查询文本
+
+        Returns:
+            csr_matrix: 形状为(1, n_features)的TF-IDF查询向量
+                (经encode缓存后会被多个调用方共享，因此底层数组为只读)
+        """
+        vocabulary = self.vocabulary
+        counts = Counter()
+        for token in self.tokenize(query):
+            index = vocabulary.get(token)
+            if index is not None:
+                counts[index] += 1
+
+        indices = np.fromiter(sorted(counts), dtype=np.int32, count=len(counts))
+        data = np.fromiter((counts[i] for i in indices), dtype=self.dtype, count=len(indices))
+
+        if self.binary:
+            data[:] = 1
+        elif self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1
+        if self.idf is not None:
+            data *= self.idf[indices]
+        if self.norm == 'l2':
+            norm = np.sqrt(np.dot(data, data))
+        elif self.norm == 'l1':
+            norm = np.abs(data).sum()
+        else:
+            norm = 0.0
+        if norm > 0:
+            data /= norm
+
+        indptr = np.array([0, len(indices)], dtype=np.int32)
+        query_vec = csr_matrix((data, indices, indptr), shape=(1, self.n_features))
+        for array in (query_vec.data, query_vec.indices, query_vec.indptr):
+            array.flags.writeable = False
+        return query_vec
+
+    def cache_info(self):
+        """获取LRU缓存统计信息"""
+        if hasattr(self.encode, 'cache_info'):
+            return self.encode.cache_info()
+        return None
+
+    def clear_cache(self):
+        """清空查询缓存"""
+        if hasattr(self.encode, 'cache_clear'):
+            self.encode.cache_clear()
+
+def benchmark_query_encoder(encoder: QueryEncoder, queries: List[str], repeats: int = 5) -> Dict:
+    """
+    对比QueryEncoder与vectorizer.transform的单查询编码耗时
+
+    Args:
+        encoder: 查询编码器
+        queries: 测试查询列表
+        repeats: 重复轮数
+
+    Returns:
+        Dict: 每个查询的平均耗时(微秒)、加速比及两种编码结果的最大误差
+    """
+    vectorizer = encoder.vectorizer
+    n_calls = len(queries) * repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            vectorizer.transform([query])
+    transform_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            encoder.encode_uncached(query)
+    encoder_time = time.perf_counter() - start
+
+    encoder.clear_cache()
+    for query in queries:
+        encoder.encode(query)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            encoder.encode(query)
+    cached_time = time.perf_counter() - start
+
+    max_abs_diff = 0.0
+    for query in queries:
+        diff = vectorizer.transform([query]) - encoder.encode_uncached(query)
+        if diff.nnz:
+            max_abs_diff = max(max_abs_diff, float(abs(diff).max()))
+
+    return {
+        'queries': len(queries),
+        'transform_us': transform_time / n_calls * 1e6,
+        'encoder_us': encoder_time / n_calls * 1e6,
+        'cached_us': cached_time / n_calls * 1e6,
+        'speedup': transform_time / encoder_time if encoder_time > 0 else float('inf'),
+        'cached_speedup': transform_time / cached_time if cached_time > 0 else float('inf'),
+        'max_abs_diff': max_abs_diff
+    }
@@ -2,27 +2,45 @@
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.metrics.pairwise import linear_kernel
 from typing import List, Dict
 
+from retrieval.query_encoder import QueryEncoder
+
 class TFIDFRetriever:
     """TF-IDF检索器 - 基于你的demo代码"""
     
-    def __init__(self, documents: List[str], doc_ids: List[str]):
+    def __init__(self, documents: List[str], doc_ids: List[str], query_cache_size: int = 1024):
         """
         初始化TF-IDF检索器
         
         Args:
             documents: 文档内容列表
             doc_ids: 文档ID列表
+            query_cache_size: 查询向量LRU缓存大小
         """
         self.documents = documents
         self.doc_ids = doc_ids
         self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
         print("正在计算TF-IDF向量...")
         self.doc_vectors = self.vectorizer.fit_transform(documents)
+        self.query_encoder = QueryEncoder(self.vectorizer, cache_size=query_cache_size)
         print("TF-IDF计算完成!")
     
+    def score(self, query: str) -> np.ndarray:
+        """
+        计算查询与所有文档的余弦相似度
+        
+        Args:
+            query: 查询文本
+            
+        Returns:
+            np.ndarray: 每个文档的相似度分数
+        """
+        # 查询向量与文档向量均已L2归一化，点积即余弦相似度
+        query_vec = self.query_encoder.encode(query)
+        return linear_kernel(query_vec, self.doc_vectors).flatten()
+    
     def retrieve(self, query: str, top_k: int = 10) -> List[Dict]:
         """
         检索最相关的文档
@@ -35,8 +53,7 @@ class TFIDFRetriever:
             List[Dict]: 检索到的文档列表，每个文档包含id, content, score
         """
         try:
-            query_vec = self.vectorizer.transform([query])
-            similarities = cosine_similarity(query_vec, self.doc_vectors).flatten()
+            similarities = self.score(query)
             
             top_indices = similarities.argsort()[-top_k:][::-1]
             
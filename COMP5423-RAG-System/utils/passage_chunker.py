@@ -0,0 +1,84 @@
+
+from typing import Dict, List, Tuple
+
+class PassageChunker:
+    """段落切分器 - 将长文档切分为相互重叠的段落"""
+
+    def __init__(self, chunk_size: int = 100, overlap: int = 20):
+        """
+        初始化段落切分器
+
+        Args:
+            chunk_size: 每个段落的词数
+            overlap: 相邻段落之间重叠的词数
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size必须大于0")
+        if not 0 <= overlap < chunk_size:
+            raise ValueError("overlap必须满足 0 <= overlap < chunk_size")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.stride = chunk_size - overlap
+
+    def spans(self, n_words: int) -> List[Tuple[int, int]]:
+        """
+        计算段落在文档词序列中的位置
+
+        Args:
+            n_words: 文档词数
+
+        Returns:
+            List[Tuple[int, int]]: 每个段落的[起始, 结束)词下标 (空文档也返回一个空段落)
+        """
+        if n_words <= self.chunk_size:
+            return [(0, n_words)]
+
+        spans = []
+        for start in range(0, n_words, self.stride):
+            spans.append((start, min(start + self.chunk_size, n_words)))
+            if start + self.chunk_size >= n_words:
+                break
+        return spans
+
+    def split(self, text: str) -> List[str]:
+        """
+        切分单个文档
+
+        Args:
+            text: 文档内容
+
+        Returns:
+            List[str]: 段落列表
+        """
+        words = text.split()
+        return [" ".join(words[start:end]) for start, end in self.spans(len(words))]
+
+    def chunk_documents(self, documents: List[str], doc_ids: List[str]) -> Dict:
+        """
+        切分整个文档集合
+
+        Args:
+            documents: 文档内容列表
+            doc_ids: 文档ID列表
+
+        Returns:
+            Dict: 包含段落内容、段落ID、段落词下标范围及每个文档首个段落位置的字典
+        """
+        chunks = []
+        chunk_ids = []
+        chunk_spans = []
+        doc_offsets = []
+        for doc_id, text in zip(doc_ids, documents):
+            doc_offsets.append(len(chunks))
+            words = text.split()
+            for chunk_no, (start, end) in enumerate(self.spans(len(words))):
+                chunks.append(" ".join(words[start:end]))
+                chunk_ids.append(f"{doc_id}#{chunk_no}")
+                chunk_spans.append((start, end))
+
+        return {
+            'chunks': chunks,
+            'chunk_ids': chunk_ids,
+            'chunk_spans': chunk_spans,
+            'doc_offsets': doc_offsets
+        }